@@ -0,0 +1,105 @@
+import asyncio
+import io
+import time
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import AsyncClient, Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from core.models import PickupRequest
+
+# (role, path) pairs hit on every round; covers the async read-heavy views
+ENDPOINTS = [
+    ("user", "/"),
+    ("user", "/requests/"),
+    ("user", "/helper/?q=bat"),
+    ("staff", "/"),
+    ("staff", "/collector/"),
+    ("staff", "/collector/?status=REQUESTED"),
+]
+
+
+class Command(BaseCommand):
+    help = "Compares WSGI vs ASGI throughput of the main views on a throwaway seeded database."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=300, help="Requests per handler.")
+        parser.add_argument("--concurrency", type=int, default=20, help="In-flight ASGI requests.")
+        parser.add_argument("--pickups", type=int, default=500, help="Pickup requests to seed.")
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0)
+        try:
+            users = self.seed(options["pickups"])
+            total = options["requests"]
+
+            wsgi_secs = self.run_wsgi(users, total)
+            asgi_secs = asyncio.run(self.run_asgi(users, total, options["concurrency"]))
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        self.stdout.write(f"Dataset: {options['pickups']} pickups, {total} requests per handler")
+        asgi_label = f"ASGI (concurrency={options['concurrency']})"
+        self.stdout.write(f"{'WSGI (sequential)':<24} {total / wsgi_secs:8.1f} req/s")
+        self.stdout.write(f"{asgi_label:<24} {total / asgi_secs:8.1f} req/s")
+        self.stdout.write(self.style.SUCCESS(f"ASGI/WSGI ratio: {wsgi_secs / asgi_secs:.2f}x"))
+
+    def seed(self, count):
+        call_command("seed_guides", stdout=io.StringIO())
+
+        user = User.objects.create_user(username="bench_user", password="bench-pass")
+        staff = User.objects.create_user(username="bench_staff", password="bench-pass", is_staff=True)
+
+        waste_types = [code for code, _ in PickupRequest.WASTE_TYPES]
+        statuses = [code for code, _ in PickupRequest.STATUS]
+        PickupRequest.objects.bulk_create(
+            PickupRequest(
+                created_by=user,
+                full_name=f"Bench User {i}",
+                waste_type=waste_types[i % len(waste_types)],
+                quantity="M",
+                address=f"{i} Bench Street",
+                status=statuses[i % len(statuses)],
+            )
+            for i in range(count)
+        )
+        return {"user": user, "staff": staff}
+
+    def run_wsgi(self, users, total):
+        clients = {}
+        for role, user in users.items():
+            clients[role] = Client()
+            clients[role].force_login(user)
+
+        start = time.perf_counter()
+        for i in range(total):
+            role, path = ENDPOINTS[i % len(ENDPOINTS)]
+            self.expect_ok(clients[role].get(path), path)
+        return time.perf_counter() - start
+
+    async def run_asgi(self, users, total, concurrency):
+        clients = {}
+        for role, user in users.items():
+            clients[role] = AsyncClient()
+            await clients[role].aforce_login(user)
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def fetch(i):
+            role, path = ENDPOINTS[i % len(ENDPOINTS)]
+            async with sem:
+                self.expect_ok(await clients[role].get(path), path)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(fetch(i) for i in range(total)))
+        return time.perf_counter() - start
+
+    def expect_ok(self, response, path):
+        if response.status_code != 200:
+            raise RuntimeError(f"{path} returned {response.status_code}")
@@ -2,6 +2,7 @@ from django.contrib import messages
 from django.contrib.auth import authenticate, login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.models import User
+from django.db.models import Count, Q
 from django.http import HttpResponseForbidden, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.views.decorators.http import require_http_methods
@@ -17,17 +18,25 @@ except ImportError:
     GEMINI_AVAILABLE = False
 
 
-def home(request):
+async def _auser(request):
+    # Resolve the user via async auth and pin it on the request, so the auth
+    # context processor doesn't fall back to a sync session/user lookup.
+    request.user = await request.auser()
+    return request.user
+
+
+async def home(request):
     # Keep home accessible; stats only to staff
+    user = await _auser(request)
     stats = None
-    if request.user.is_authenticated and request.user.is_staff:
-        stats = {
-            "total": PickupRequest.objects.filter(created_by__isnull=False).count(),
-            "wet": PickupRequest.objects.filter(created_by__isnull=False, waste_type="WET").count(),
-            "dry": PickupRequest.objects.filter(created_by__isnull=False, waste_type="DRY").count(),
-            "ewaste": PickupRequest.objects.filter(created_by__isnull=False, waste_type="EWASTE").count(),
-            "hazard": PickupRequest.objects.filter(created_by__isnull=False, waste_type="HAZARD").count(),
-        }
+    if user.is_authenticated and user.is_staff:
+        stats = await PickupRequest.objects.filter(created_by__isnull=False).aaggregate(
+            total=Count("id"),
+            wet=Count("id", filter=Q(waste_type="WET")),
+            dry=Count("id", filter=Q(waste_type="DRY")),
+            ewaste=Count("id", filter=Q(waste_type="EWASTE")),
+            hazard=Count("id", filter=Q(waste_type="HAZARD")),
+        )
     return render(request, "core/home.html", {"stats": stats})
 
 
@@ -60,24 +69,26 @@ def request_new(request):
 
 
 @login_required(login_url="/user/login/")
-def my_requests(request):
+async def my_requests(request):
     # Block collectors from user page
-    if request.user.is_staff:
+    user = await _auser(request)
+    if user.is_staff:
         return redirect("collector")
 
-    requests = PickupRequest.objects.filter(created_by=request.user)[:50]
+    requests = [r async for r in PickupRequest.objects.filter(created_by=user)[:50].aiterator()]
     return render(request, "core/requests_list.html", {"requests": requests})
 
 
-def helper(request):
+async def helper(request):
     # Block collectors from user feature
-    if request.user.is_authenticated and request.user.is_staff:
+    user = await _auser(request)
+    if user.is_authenticated and user.is_staff:
         return redirect("collector")
 
     q = request.GET.get("q", "").strip()
     results = []
     if q:
-        results = WasteGuideItem.objects.filter(item_name__icontains=q)[:20]
+        results = [i async for i in WasteGuideItem.objects.filter(item_name__icontains=q)[:20].aiterator()]
         if not results:
             messages.info(request, "No exact match found. Try simpler keyword like “battery”, “peel”, “packet”.")
     return render(request, "core/helper.html", {"q": q, "results": results})
@@ -169,8 +180,9 @@ def collector_logout_view(request):
 
 
 @login_required(login_url="/collector/login/")
-def collector_dashboard(request):
-    if not request.user.is_staff:
+async def collector_dashboard(request):
+    user = await _auser(request)
+    if not user.is_staff:
         return HttpResponseForbidden("Collector access only.")
 
     status = request.GET.get("status", "ALL")
@@ -179,13 +191,13 @@ def collector_dashboard(request):
     if status in {"REQUESTED", "ASSIGNED", "PICKED"}:
         pickups = pickups.filter(status=status)
 
-    pickups = pickups[:200]
+    pickups = [p async for p in pickups[:200].aiterator()]
 
-    counts = {
-        "requested": PickupRequest.objects.filter(created_by__isnull=False, status="REQUESTED").count(),
-        "assigned": PickupRequest.objects.filter(created_by__isnull=False, status="ASSIGNED").count(),
-        "picked": PickupRequest.objects.filter(created_by__isnull=False, status="PICKED").count(),
-    }
+    counts = await PickupRequest.objects.filter(created_by__isnull=False).aaggregate(
+        requested=Count("id", filter=Q(status="REQUESTED")),
+        assigned=Count("id", filter=Q(status="ASSIGNED")),
+        picked=Count("id", filter=Q(status="PICKED")),
+    )
 
     return render(
         request,
@@ -227,7 +239,7 @@ def chatbot(request):
 
 
 @require_http_methods(["POST"])
-def chatbot_message(request):
+async def chatbot_message(request):
     """Handle chatbot messages via API"""
     if not GEMINI_AVAILABLE:
         return JsonResponse({"error": "Gemini API not available"}, status=500)
@@ -263,7 +275,7 @@ Always be concise and helpful. If someone asks about non-waste related topics, p
         model = genai.GenerativeModel("gemini-2.5-flash", 
                                      system_instruction=system_prompt)
         
-        response = model.generate_content(user_message)
+        response = await model.generate_content_async(user_message)
         bot_reply = response.text
         
         return JsonResponse({"reply": bot_reply})